@@ -1,10 +1,11 @@
 """Todoist plugin for Albert launcher."""
 
 from albert import *
-import json
-import requests
+import sys
 import threading
-from datetime import datetime, date
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from functools import lru_cache, partial
 
 md_iid = "4.0"
 md_version = "1.2"
@@ -19,6 +20,221 @@ md_lib_dependencies = ["requests"]
 # API endpoints
 TODOIST_API_BASE = "https://api.todoist.com/api/v1"
 TODOIST_WEB_BASE = "https://todoist.com/app"
+TODOIST_TASK_URL = TODOIST_WEB_BASE + "/task/{}"
+TODOIST_PROJECT_URL = TODOIST_WEB_BASE + "/project/{}"
+
+# Retry policy for API calls. Only failures where Todoist cannot have acted on the
+# request are retried, since quick add is not idempotent.
+API_RETRY = {
+    "total": 3,
+    "connect": 3,
+    "read": 0,
+    "status": 3,
+    "backoff_factor": 0.5,
+    "status_forcelist": (429, 503),
+    "allowed_methods": frozenset({"POST"}),
+    "respect_retry_after_header": True,
+    "raise_on_status": False,
+}
+
+# (connect, read) timeouts in seconds
+API_TIMEOUT = (3, 10)
+SYNC_TIMEOUT = (3, 15)
+
+# Sync request resource types, as the JSON array the form field expects
+SYNC_RESOURCE_TYPES = '["items", "projects", "user"]'
+
+
+# Task fields the plugin reads; everything else in a synced task is dropped
+TASK_FIELDS = ("id", "content", "project_id", "checked", "is_deleted", "due", "day_order")
+
+# Optional accelerators, imported on first use so loading the plugin stays cheap.
+# None until the first import attempt, False if the library is not installed.
+_rapidfuzz = None
+_loads = None
+
+
+def _import_rapidfuzz() -> tuple:
+    """Return rapidfuzz's (fuzz, process) modules, or None if not installed."""
+    global _rapidfuzz
+    if _rapidfuzz is None:
+        try:
+            from rapidfuzz import fuzz, process
+
+            _rapidfuzz = (fuzz, process)
+        except ImportError:
+            _rapidfuzz = False
+    return _rapidfuzz or None
+
+
+def _json_loads():
+    """Return orjson's loads if installed, else the stdlib one."""
+    global _loads
+    if _loads is None:
+        try:
+            from orjson import loads
+        except ImportError:
+            from json import loads
+        _loads = loads
+    return _loads
+
+
+def _slim_task(task: dict) -> dict:
+    """Return task reduced to TASK_FIELDS, with its project_id interned.
+
+    Synced tasks are kept for the plugin's lifetime, and most tasks share a
+    handful of project ids.
+    """
+    slim = {k: task[k] for k in TASK_FIELDS if k in task}
+    if slim.get("project_id") is not None:
+        slim["project_id"] = sys.intern(str(slim["project_id"]))
+    return slim
+
+
+def _bigrams(text: str) -> set:
+    return {text[i : i + 2] for i in range(len(text) - 1)}
+
+
+def _parse_due_date(date_str: str) -> date:
+    """Parse a Todoist due date or datetime string to a date, or None.
+
+    Both forms start with YYYY-MM-DD, the date as written (for datetimes, in
+    the timezone they are given in), so only that prefix is parsed.
+    """
+    if not date_str:
+        return None
+    try:
+        return date.fromisoformat(date_str[:10])
+    except ValueError:
+        return None
+
+
+def _format_due_date(due: dict) -> str:
+    if not due:
+        return ""
+    return due.get("date") or due.get("datetime") or ""
+
+
+def _exact_matches(cache: tuple, term: str, haystack: list) -> list:
+    """Return the indices of haystack entries containing every word of term.
+
+    term must already be lowercased, like the lists built by _TaskIndex that
+    are passed as haystack. When term extends the cached query only the cached
+    hits are checked again, since extending the query can only narrow an exact
+    match.
+    """
+    prev_term, prev_hits = cache
+    if prev_hits is not None and prev_term and term.startswith(prev_term):
+        candidates = prev_hits
+    else:
+        candidates = range(len(haystack))
+
+    needles = term.split()
+    if len(needles) == 1:
+        needle = needles[0]
+        return [i for i in candidates if needle in haystack[i]]
+    return [i for i in candidates if all(n in haystack[i] for n in needles)]
+
+
+class _TaskIndex:
+    """Synced tasks and projects, with the precomputed views queries slice.
+
+    Built by the sync thread and published with a single attribute assignment,
+    so a query that reads Plugin._index once sees one consistent snapshot.
+    Apart from the query caches and the today list it is never modified after
+    construction.
+    """
+
+    def __init__(self, tasks: list, projects: list):
+        active = [t for t in tasks if not t.get("checked") and not t.get("is_deleted")]
+        active_sorted = sorted(active, key=lambda x: x.get("day_order") or 0)
+
+        # Parallel per-task arrays, so query loops scan flat lists instead of dicts
+        self.active_tasks = active
+        self.active_contents_lower = [(t.get("content") or "").lower() for t in active]
+        self.active_tasks_sorted = active_sorted
+        self.active_sorted_due_dates = [_parse_due_date(_format_due_date(t.get("due"))) for t in active_sorted]
+        self.today_tasks = []
+        self.date = None
+        self.tasks_due_today()
+
+        # Lookup tables for project queries
+        self.projects = projects
+        self.tasks_by_project = {}
+        for t in active:
+            self.tasks_by_project.setdefault(str(t.get("project_id")), []).append(t)
+        self.project_names_lower = [(p.get("name") or "").lower() for p in projects]
+        self.projects_by_name_lower = {}
+        for p, name in zip(projects, self.project_names_lower):
+            self.projects_by_name_lower.setdefault(name, p)
+        self.project_bigrams = [_bigrams(name) for name in self.project_names_lower]
+        self.project_bigram_index = {}
+        for i, bigrams in enumerate(self.project_bigrams):
+            for bigram in bigrams:
+                self.project_bigram_index.setdefault(bigram, []).append(i)
+
+        # Query caches, dropped together with the snapshot they were computed from:
+        # last (query, hit indices) pairs for _exact_matches, and an LRU cache so
+        # repeated searches (e.g. after backspace) skip matching entirely
+        self.search_cache = ("", None)
+        self.project_cache = ("", None)
+        self.search_hits = lru_cache(maxsize=128)(self._compute_search_hits)
+
+        # Result items by (task id, project name), built the first time a task is shown
+        self.task_items = {}
+
+    def tasks_due_today(self) -> list:
+        """Return the active tasks due today, sorted by day_order.
+
+        Built at sync time and rebuilt once when the date rolls over, so every
+        other call is a plain attribute read.
+        """
+        today = date.today()
+        if self.date != today:
+            # today_tasks first: a concurrent caller seeing the new date must see the new list
+            self.today_tasks = [t for t, d in zip(self.active_tasks_sorted, self.active_sorted_due_dates) if d == today]
+            self.date = today
+        return self.today_tasks
+
+    def _compute_search_hits(self, search_term: str, fuzzy: bool) -> tuple:
+        """Return the indices into active_tasks matching the lowercased search_term."""
+        if fuzzy:
+            # Scores every task in C++ and returns them ranked, best first. partial_ratio
+            # scores the best-matching substring, which suits short queries on long tasks.
+            fuzz, process = _import_rapidfuzz()
+            hits = process.extract(
+                search_term,
+                self.active_contents_lower,
+                scorer=fuzz.partial_ratio,
+                score_cutoff=60,
+                limit=None,
+            )
+            return tuple(i for _, _, i in hits)
+
+        hits = _exact_matches(self.search_cache, search_term, self.active_contents_lower)
+        self.search_cache = (search_term, hits)
+        return tuple(hits)
+
+    def match_project_bigrams(self, name_lower: str) -> dict:
+        """Return the project whose name shares the most bigrams with name_lower.
+
+        Only projects sharing at least one bigram are scored, via the inverted
+        index. A project must contain more than half of the query's bigrams to
+        match; ties go to the closer overall (Jaccard) match.
+        """
+        query_bigrams = _bigrams(name_lower)
+        candidates = set()
+        for bigram in query_bigrams:
+            candidates.update(self.project_bigram_index.get(bigram, ()))
+
+        best, best_score = None, (0.0, 0.0)
+        for i in sorted(candidates):
+            name_bigrams = self.project_bigrams[i]
+            shared = len(query_bigrams & name_bigrams)
+            score = (shared / len(query_bigrams), shared / len(query_bigrams | name_bigrams))
+            if score[0] > 0.5 and score > best_score:
+                best, best_score = i, score
+        return self.projects[best] if best is not None else None
 
 
 class Plugin(PluginInstance, TriggerQueryHandler):
@@ -29,18 +245,57 @@ class Plugin(PluginInstance, TriggerQueryHandler):
         TriggerQueryHandler.__init__(self)
 
         # Runtime state (not persisted)
-        self._projects: list = []
-        self._tasks: list = []
         self._user: dict = {}
         self._fuzzy: bool = False
+        self._fuzzy_match_config = MatchConfig(fuzzy=True)  # for the Matcher fallbacks
         self._syncing: bool = False
-
-        # Initial sync if token is configured
-        if self._get_api_token():
-            self._refresh_tasks(show_notification=False)
-        else:
+        self._pending_sync: bool = None  # show_notification of a queued follow-up sync
+        self._has_synced: bool = False
+
+        # Incremental sync state: "*" requests a full sync, later syncs only return changes.
+        # Writes to it and to the _syncing/_pending_sync flags go through _state_lock.
+        self._state_lock = threading.Lock()
+        self._sync_token: str = "*"
+        self._token_generation: int = 0  # bumped on token changes, see _apply_sync
+        self._tasks_by_id: dict = {}
+        self._projects_by_id: dict = {}
+
+        # Everything queries read, swapped as a whole after each sync (see _TaskIndex)
+        self._index = _TaskIndex([], [])
+
+        # API calls run on this pool so actions never block the Albert UI
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="todoist")
+
+        # Shared HTTP session so API calls reuse the TLS connection, see _get_session
+        self._session = None
+
+        # Config cache (readConfig is too slow for the per-keystroke path)
+        self._api_token: str = self._get_api_token()
+        self._max_tasks: int = self._get_max_tasks()
+        self._project: str = self._get_project_filter()
+        self._show_today_only: bool = self._get_show_today_only()
+
+        # Query routing: whole-query commands, then "<command> <argument>" commands.
+        # Anything else searches tasks.
+        self._exact_commands = {
+            "": self._show_default_options,
+            "today": self._show_today_tasks,
+        }
+        self._commands = {
+            "add": self._handle_add_task,
+            "project": self._handle_project_query,
+        }
+
+        # The initial sync waits for the first query, keeping it off Albert's startup path
+        self._needs_initial_sync: bool = True
+        if not self._api_token:
             info("No Todoist API token configured")
 
+    def __del__(self):
+        self._executor.shutdown(wait=False)
+        if self._session is not None:
+            self._session.close()
+
     # -------------------------------------------------------------------------
     # Extension interface
     # -------------------------------------------------------------------------
@@ -65,9 +320,12 @@ class Plugin(PluginInstance, TriggerQueryHandler):
 
     def setFuzzyMatching(self, enabled: bool):
         self._fuzzy = enabled
+        if enabled:
+            # Import here rather than on the first fuzzy keystroke
+            _import_rapidfuzz()
 
     # -------------------------------------------------------------------------
-    # Config helpers (cached reads to avoid I/O on every keystroke)
+    # Config helpers (only used to populate the config cache)
     # -------------------------------------------------------------------------
 
     def _get_api_token(self) -> str:
@@ -87,37 +345,58 @@ class Plugin(PluginInstance, TriggerQueryHandler):
     # Config widget (for Albert settings UI)
     # -------------------------------------------------------------------------
 
+    def _write_config(self, key: str, value):
+        """Write a config value through the cache, skipping unchanged values."""
+        if getattr(self, f"_{key}") == value:
+            return
+        setattr(self, f"_{key}", value)
+        self.writeConfig(key, value)
+
     @property
     def api_token(self) -> str:
-        return self._get_api_token()
+        return self._api_token
 
     @api_token.setter
     def api_token(self, value: str):
+        if value == self._api_token:
+            return
+
+        # Deltas for another account would be merged into the wrong state: start over
+        # with a full sync, and make a sync still running for the old token discard its result
+        with self._state_lock:
+            self._api_token = value
+            self._sync_token = "*"
+            self._token_generation += 1
+            if self._session is not None:
+                self._session.headers["Authorization"] = f"Bearer {value}"
+            self._index = _TaskIndex([], [])
+            self._has_synced = False
+            self._needs_initial_sync = True
         self.writeConfig("api_token", value)
 
     @property
     def max_tasks(self) -> int:
-        return self._get_max_tasks()
+        return self._max_tasks
 
     @max_tasks.setter
     def max_tasks(self, value: int):
-        self.writeConfig("max_tasks", value)
+        self._write_config("max_tasks", value)
 
     @property
     def project(self) -> str:
-        return self._get_project_filter()
+        return self._project
 
     @project.setter
     def project(self, value: str):
-        self.writeConfig("project", value)
+        self._write_config("project", value)
 
     @property
     def show_today_only(self) -> bool:
-        return self._get_show_today_only()
+        return self._show_today_only
 
     @show_today_only.setter
     def show_today_only(self, value: bool):
-        self.writeConfig("show_today_only", value)
+        self._write_config("show_today_only", value)
 
     def configWidget(self) -> list:
         return [
@@ -165,180 +444,197 @@ class Plugin(PluginInstance, TriggerQueryHandler):
         if not query.isValid:
             return
 
-        token = self._get_api_token()
-        if not token:
+        if not self._api_token:
             query.add(self._make_no_token_item())
             return
 
+        if self._needs_initial_sync:
+            self._needs_initial_sync = False
+            self._refresh_tasks(show_notification=False)
+
         query_string = query.string.strip()
 
-        if not query_string:
-            self._show_default_options(query)
-        elif query_string == "today":
-            self._show_today_tasks(query)
-        elif query_string.startswith("add "):
-            self._handle_add_task(query, query_string[4:])
-        elif query_string.startswith("project "):
-            self._handle_project_query(query, query_string[8:])
+        # Read the index once; a sync may publish a new one while this query runs
+        index = self._index
+
+        # Handlers return their items so each query crosses into Albert only once
+        handler = self._exact_commands.get(query_string)
+        if handler is not None:
+            items = handler(query, index)
         else:
-            self._search_tasks(query, query_string)
+            command, _, argument = query_string.partition(" ")
+            handler = self._commands.get(command)
+            if handler is not None:
+                items = handler(query, index, argument)
+            else:
+                items = self._search_tasks(query, index, query_string)
+
+        # Nothing to search yet: let the user know the first sync is running
+        if self._syncing and not self._has_synced:
+            items = [self._make_syncing_item()] + items
+
+        if items and query.isValid:
+            query.add(items)
 
-    def _show_default_options(self, query: Query):
+    def _show_default_options(self, query: Query, index: _TaskIndex) -> list:
         if not query.isValid:
-            return
+            return []
 
         items = [
             StandardItem(
                 id="add-task",
                 text="Add new task",
                 subtext="td add <task content>",
-                actions=[Action("add", "Open Todoist", lambda: openUrl(f"{TODOIST_WEB_BASE}/today"))],
+                actions=[Action("add", "Open Todoist", partial(openUrl, f"{TODOIST_WEB_BASE}/today"))],
             ),
             StandardItem(
                 id="refresh",
                 text="Refresh tasks",
                 subtext="Sync with Todoist",
-                actions=[Action("refresh", "Refresh", lambda: self._refresh_tasks())],
+                actions=[Action("refresh", "Refresh", self._refresh_tasks)],
             ),
         ]
-        query.add(items)
-        self._show_today_tasks(query)
+        return items + self._show_today_tasks(query, index)
 
-    def _handle_add_task(self, query: Query, content: str):
+    def _handle_add_task(self, query: Query, index: _TaskIndex, content: str) -> list:
         if not query.isValid:
-            return
+            return []
 
         content = content.strip()
         if not content:
-            return
+            return [self._make_empty_item("Add task", "Type the task content, e.g. td add buy milk tomorrow")]
 
-        query.add(
+        return [
             StandardItem(
                 id="add-task-action",
                 text=f"Add task: {content}",
                 subtext="dates, #Project, @label, p1-p4, // description",
-                actions=[Action("add", "Add task", lambda c=content: self._add_task(c))],
+                actions=[Action("add", "Add task", partial(self._add_task, content))],
             )
-        )
+        ]
 
-    def _handle_project_query(self, query: Query, project_name: str):
+    def _handle_project_query(self, query: Query, index: _TaskIndex, project_name: str) -> list:
         if not query.isValid:
-            return
+            return []
 
         project_name = project_name.strip()
 
         # No project name: show all projects
         if not project_name:
-            items = [
-                StandardItem(
-                    id=str(p.get("id")),
-                    text=p.get("name", "Unknown"),
-                    subtext=f"Type 'td project {p.get('name')}' to see tasks",
-                    actions=[
-                        Action(
-                            "open",
-                            "Open Project",
-                            lambda pid=p.get("id"): openUrl(f"{TODOIST_WEB_BASE}/project/{pid}"),
-                        )
-                    ],
-                )
-                for p in self._projects
-            ]
-            query.add(items) if items else query.add(self._make_empty_item("No projects"))
-            return
-
-        # Find matching project
-        matcher = Matcher(project_name, MatchConfig(fuzzy=self._fuzzy))
-        matching_project = next((p for p in self._projects if matcher.match(p.get("name", ""))), None)
+            items = [self._make_project_item(p) for p in index.projects]
+            return items or [self._make_empty_item("No projects")]
+
+        # Find matching project; an exact (case-insensitive) name wins over partial matches
+        name_lower = project_name.lower()
+        matching_project = index.projects_by_name_lower.get(name_lower)
+        if matching_project is None:
+            if self._fuzzy and len(project_name) > 1:
+                matching_project = index.match_project_bigrams(name_lower)
+            elif self._fuzzy:
+                matcher = Matcher(project_name, self._fuzzy_match_config)
+                for p in index.projects:
+                    if not query.isValid:
+                        return []
+                    if matcher.match(p.get("name", "")):
+                        matching_project = p
+                        break
+            else:
+                hits = _exact_matches(index.project_cache, name_lower, index.project_names_lower)
+                index.project_cache = (name_lower, hits)
+                matching_project = index.projects[hits[0]] if hits else None
 
         if not matching_project:
-            query.add(self._make_empty_item("No matching project", "Try a different name"))
-            return
+            return [self._make_empty_item("No matching project", "Try a different name")]
+
+        if not query.isValid:
+            return []
 
         project_id = matching_project.get("id")
         project_display_name = matching_project.get("name", "Unknown")
 
-        # Filter tasks for this project
-        project_tasks = [
-            t
-            for t in self._tasks
-            if str(t.get("project_id")) == str(project_id)
-            and not t.get("checked")
-            and not t.get("is_deleted")
-        ]
+        project_tasks = index.tasks_by_project.get(str(project_id), [])
 
         if not project_tasks:
-            query.add(
+            return [
                 StandardItem(
                     id="no-tasks",
                     text=f"No tasks in {project_display_name}",
                     subtext="All tasks completed or project is empty",
                     actions=[
-                        Action("open", "Open Project", lambda: openUrl(f"{TODOIST_WEB_BASE}/project/{project_id}"))
+                        Action("open", "Open Project", partial(openUrl, TODOIST_PROJECT_URL.format(project_id)))
                     ],
                 )
-            )
-            return
-
-        items = [self._make_task_item(t, project_display_name) for t in project_tasks]
-        query.add(items)
+            ]
 
-    def _search_tasks(self, query: Query, search_term: str):
         if not query.isValid:
-            return
+            return []
 
-        matcher = Matcher(search_term, MatchConfig(fuzzy=self._fuzzy))
-        items = []
-
-        for t in self._tasks:
-            if not query.isValid:
-                return
-            if t.get("checked") or t.get("is_deleted"):
-                continue
-            if matcher.match(t.get("content", "")):
-                items.append(self._make_task_item(t))
+        return [self._task_item(index, t, project_display_name) for t in project_tasks]
 
-        if items:
-            query.add(items)
+    def _search_tasks(self, query: Query, index: _TaskIndex, search_term: str) -> list:
+        if not query.isValid:
+            return []
+
+        if self._fuzzy and _import_rapidfuzz() is None:
+            matcher = Matcher(search_term, self._fuzzy_match_config)
+            matches = []
+            for t in index.active_tasks:
+                if not query.isValid:
+                    return []
+                if matcher.match(t.get("content", "")):
+                    matches.append(t)
         else:
-            query.add(self._make_empty_item("No matching tasks", "Try a different query"))
+            # Lowercased once here, which also lets searches differing only in case share cache entries
+            hits = index.search_hits(search_term.lower(), self._fuzzy)
+            if self._fuzzy:
+                hits = hits[: self._max_tasks]
+            matches = [index.active_tasks[i] for i in hits]
 
-    def _show_today_tasks(self, query: Query):
+        # Typing on may have superseded this query while matching
         if not query.isValid:
-            return
+            return []
 
-        max_tasks = self._get_max_tasks()
-        show_today = self._get_show_today_only()
-        today = date.today()
+        items = [self._task_item(index, t) for t in matches]
+        return items or [self._make_empty_item("No matching tasks", "Try a different query")]
 
-        # Filter tasks
-        filtered = [
-            t
-            for t in self._tasks
-            if not t.get("checked")
-            and not t.get("is_deleted")
-            and (not show_today or self._is_due_on_date(t.get("due"), today))
-        ]
+    def _show_today_tasks(self, query: Query, index: _TaskIndex) -> list:
+        if not query.isValid:
+            return []
+
+        max_tasks = self._max_tasks
+        show_today = self._show_today_only
 
-        # Sort by day_order
-        filtered.sort(key=lambda x: x.get("day_order") or 0)
+        if show_today:
+            filtered = index.tasks_due_today()[:max_tasks]
+        else:
+            filtered = index.active_tasks_sorted[:max_tasks]
 
         if not filtered:
-            query.add(self._make_empty_item("No tasks", "No tasks matched the filters"))
-            return
+            return [self._make_empty_item("No tasks", "No tasks matched the filters")]
 
-        items = [self._make_task_item(t) for t in filtered[:max_tasks]]
-        query.add(items)
+        return [self._task_item(index, t) for t in filtered]
 
     # -------------------------------------------------------------------------
     # Item factory helpers
     # -------------------------------------------------------------------------
 
+    def _task_item(self, index: _TaskIndex, task: dict, project_name: str = None) -> StandardItem:
+        """Return the cached item for task, creating it on first use.
+
+        Items only depend on the task and project name, so they are reused by
+        every query until the next sync publishes a new index.
+        """
+        key = (task.get("id"), project_name)
+        item = index.task_items.get(key)
+        if item is None:
+            item = index.task_items[key] = self._make_task_item(task, project_name)
+        return item
+
     def _make_task_item(self, task: dict, project_name: str = None) -> StandardItem:
         task_id = task.get("id")
         task_content = task.get("content", "")
         due = task.get("due")
-        due_str = self._format_due_date(due)
+        due_str = _format_due_date(due)
 
         if project_name:
             subtext = f"{project_name} | {due_str}" if due_str else project_name
@@ -350,73 +646,93 @@ class Plugin(PluginInstance, TriggerQueryHandler):
             text=task_content,
             subtext=subtext,
             actions=[
-                Action("open", "Show details", lambda tid=task_id: openUrl(f"{TODOIST_WEB_BASE}/task/{tid}")),
+                Action("open", "Show details", partial(openUrl, TODOIST_TASK_URL.format(task_id))),
                 Action(
                     "done",
                     "Set as done",
-                    lambda tid=task_id, tc=task_content: self._complete_task(tid, tc),
+                    partial(self._complete_task, task_id, task_content),
                 ),
             ],
         )
 
+    def _make_project_item(self, project: dict) -> StandardItem:
+        project_id = project.get("id")
+        return StandardItem(
+            id=str(project_id),
+            text=project.get("name", "Unknown"),
+            subtext=f"Type 'td project {project.get('name')}' to see tasks",
+            actions=[Action("open", "Open Project", partial(openUrl, TODOIST_PROJECT_URL.format(project_id)))],
+        )
+
     def _make_empty_item(self, text: str, subtext: str = "") -> StandardItem:
         return StandardItem(id="empty", text=text, subtext=subtext)
 
+    def _make_syncing_item(self) -> StandardItem:
+        return StandardItem(id="syncing", text="Syncing with Todoist…", subtext="Tasks will appear shortly")
+
     def _make_no_token_item(self) -> StandardItem:
         return StandardItem(
             id="no-token",
             text="No API token configured",
             subtext="Go to plugin settings to configure your Todoist API token",
-            actions=[Action("config", "Open settings", lambda: openUrl("albert://settings"))],
+            actions=[Action("config", "Open settings", partial(openUrl, "albert://settings"))],
         )
 
-    # -------------------------------------------------------------------------
-    # Date helpers
-    # -------------------------------------------------------------------------
-
-    def _format_due_date(self, due: dict) -> str:
-        if not due:
-            return ""
-        return due.get("date") or due.get("datetime") or ""
-
-    def _is_due_on_date(self, due: dict, target_date: date) -> bool:
-        if not due:
-            return False
-        date_str = due.get("date") or due.get("datetime")
-        if not date_str:
-            return False
-        try:
-            if "T" in date_str:
-                dt = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-                return dt.date() == target_date
-            else:
-                return datetime.strptime(date_str, "%Y-%m-%d").date() == target_date
-        except Exception:
-            return False
-
     # -------------------------------------------------------------------------
     # Todoist API operations
     # -------------------------------------------------------------------------
 
+    def _get_session(self):
+        """Return the shared HTTP session, importing requests on first use.
+
+        requests pulls in urllib3, charset_normalizer and friends, which is
+        too much to load with Albert for users who never sync.
+        """
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util import Retry
+
+            try:
+                retry = Retry(**API_RETRY)
+            except TypeError:
+                # urllib3 < 1.26 calls allowed_methods method_whitelist
+                retry_args = dict(API_RETRY)
+                retry_args["method_whitelist"] = retry_args.pop("allowed_methods")
+                retry = Retry(**retry_args)
+
+            # Both pool workers may get here at once: only one may create the session.
+            # _state_lock also keeps the header in step with the api_token setter.
+            with self._state_lock:
+                if self._session is None:
+                    session = requests.Session()
+                    session.headers["Authorization"] = f"Bearer {self._api_token}"
+                    adapter = HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=retry)
+                    session.mount("https://", adapter)
+                    self._session = session
+        return self._session
+
     def _add_task(self, content: str):
+        """Add a task in the background."""
+        self._executor.submit(self._do_add_task, content)
+
+    def _do_add_task(self, content: str):
         """Add a task using Quick Add API (supports natural language)."""
-        token = self._get_api_token()
-        if not token:
+        if not self._api_token:
             return
 
         try:
-            response = requests.post(
+            response = self._get_session().post(
                 f"{TODOIST_API_BASE}/tasks/quick",
-                headers={"Authorization": f"Bearer {token}", "Content-Type": "application/json"},
                 json={"text": content, "auto_reminder": True},
-                timeout=10,
+                timeout=API_TIMEOUT,
             )
 
             if response.status_code == 200:
-                result = response.json()
-                task_content = result.get("content", content)
-                info(f"Task added: {task_content}")
-                Notification("Todoist", f"Task added: {task_content}").send()
+                # The response body is the created task, but the typed text is enough
+                # for the notification and the next sync brings in the parsed task
+                info(f"Task added: {content}")
+                Notification("Todoist", f"Task added: {content}").send()
                 self._refresh_tasks(show_notification=False)
             else:
                 self._log_api_error("add task", response)
@@ -424,16 +740,18 @@ class Plugin(PluginInstance, TriggerQueryHandler):
             critical(f"Error adding task: {e}")
 
     def _complete_task(self, task_id: str, task_content: str = ""):
+        """Mark a task as completed in the background."""
+        self._executor.submit(self._do_complete_task, task_id, task_content)
+
+    def _do_complete_task(self, task_id: str, task_content: str = ""):
         """Mark a task as completed."""
-        token = self._get_api_token()
-        if not token:
+        if not self._api_token:
             return
 
         try:
-            response = requests.post(
+            response = self._get_session().post(
                 f"{TODOIST_API_BASE}/tasks/{task_id}/close",
-                headers={"Authorization": f"Bearer {token}"},
-                timeout=10,
+                timeout=API_TIMEOUT,
             )
 
             if response.status_code in (200, 204):
@@ -446,45 +764,99 @@ class Plugin(PluginInstance, TriggerQueryHandler):
             critical(f"Error completing task: {e}")
 
     def _refresh_tasks(self, show_notification: bool = True):
-        """Start a background sync with Todoist."""
-        if self._syncing:
-            info("Sync already in progress")
-            return
+        """Start a background sync with Todoist.
+
+        While a sync is running, further requests are coalesced into a single
+        follow-up sync, so changes made meanwhile (e.g. a task just added) are
+        still picked up.
+        """
+        with self._state_lock:
+            if self._syncing:
+                info("Sync already in progress, queueing another")
+                self._pending_sync = bool(self._pending_sync) or show_notification
+                return
+            self._syncing = True
+
+        self._executor.submit(self._sync_worker, show_notification)
 
-        thread = threading.Thread(target=self._do_sync, args=(show_notification,), daemon=True)
-        thread.start()
+    def _sync_worker(self, show_notification: bool):
+        """Run syncs until no follow-up sync is pending."""
+        while True:
+            self._do_sync(show_notification)
+            with self._state_lock:
+                if self._pending_sync is None:
+                    self._syncing = False
+                    return
+                show_notification, self._pending_sync = self._pending_sync, None
 
     def _do_sync(self, show_notification: bool = True):
         """Perform sync in background thread."""
-        self._syncing = True
         try:
-            token = self._get_api_token()
-            if not token:
+            if not self._api_token:
                 warning("No API token configured")
                 return
 
             info("Syncing with Todoist...")
-            response = requests.post(
+            with self._state_lock:
+                token_generation, sync_token = self._token_generation, self._sync_token
+            response = self._get_session().post(
                 f"{TODOIST_API_BASE}/sync",
-                headers={"Authorization": f"Bearer {token}"},
-                data={"sync_token": "*", "resource_types": json.dumps(["items", "projects", "user"])},
-                timeout=15,
+                data={"sync_token": sync_token, "resource_types": SYNC_RESOURCE_TYPES},
+                timeout=SYNC_TIMEOUT,
             )
 
             if response.status_code == 200:
-                data = response.json()
-                self._projects = data.get("projects") or []
-                self._tasks = data.get("items") or []
-                self._user = data.get("user") or {}
-                info(f"Synced {len(self._projects)} projects, {len(self._tasks)} tasks")
+                data = _json_loads()(response.content)
+                if not self._apply_sync(data, token_generation):
+                    info("API token changed during sync, discarding the response")
+                    return
+                info(f"Synced {len(self._projects_by_id)} projects, {len(self._tasks_by_id)} tasks")
                 if show_notification:
-                    Notification("Todoist", f"Synced {len(self._tasks)} tasks").send()
+                    Notification("Todoist", f"Synced {len(self._tasks_by_id)} tasks").send()
             else:
+                with self._state_lock:
+                    self._sync_token = "*"
                 self._log_api_error("sync", response)
         except Exception as e:
+            with self._state_lock:
+                self._sync_token = "*"
             critical(f"Error during sync: {e}")
-        finally:
-            self._syncing = False
+
+    def _apply_sync(self, data: dict, token_generation: int) -> bool:
+        """Merge a sync response into the local state and publish a new index.
+
+        Returns False without applying anything if the API token changed since
+        the sync started (token_generation is _token_generation at that point).
+        """
+        # Only the sync thread writes _tasks_by_id/_projects_by_id, so the merge and
+        # the index build need no lock; it is only held for the swap below
+        full_sync = data.get("full_sync", True)
+
+        tasks_by_id = {} if full_sync else dict(self._tasks_by_id)
+        for t in data.get("items") or []:
+            if t.get("checked") or t.get("is_deleted"):
+                tasks_by_id.pop(t.get("id"), None)
+            else:
+                tasks_by_id[t.get("id")] = _slim_task(t)
+
+        projects_by_id = {} if full_sync else dict(self._projects_by_id)
+        for p in data.get("projects") or []:
+            if p.get("is_deleted") or p.get("is_archived"):
+                projects_by_id.pop(p.get("id"), None)
+            else:
+                projects_by_id[p.get("id")] = p
+
+        index = _TaskIndex(list(tasks_by_id.values()), list(projects_by_id.values()))
+
+        with self._state_lock:
+            if token_generation != self._token_generation:
+                return False
+            self._tasks_by_id, self._projects_by_id = tasks_by_id, projects_by_id
+            self._user = data.get("user") or self._user
+            self._sync_token = data.get("sync_token") or "*"
+            self._index = index
+            self._has_synced = True
+        return True
 
     def _log_api_error(self, action: str, response):
         """Log API error with response details."""